@@ -4,6 +4,7 @@ package agent
 import (
 	"context"
 	"log/slog"
+	"sync"
 	"time"
 
 	"github.com/onllm-dev/onwatch/internal/api"
@@ -22,6 +23,9 @@ type Agent struct {
 	sm           *SessionManager
 	notifier     *notify.NotificationEngine
 	pollingCheck func() bool
+
+	// Held for a whole poll cycle so PollNow never interleaves with Run
+	pollMu sync.Mutex
 }
 
 // SetPollingCheck sets a function that is called before each poll.
@@ -82,8 +86,17 @@ func (a *Agent) Run(ctx context.Context) error {
 	}
 }
 
+// PollNow runs a single poll cycle immediately, outside the regular interval.
+// It is safe to call while Run is active; concurrent cycles are serialized.
+func (a *Agent) PollNow(ctx context.Context) {
+	a.poll(ctx)
+}
+
 // poll performs a single poll cycle: fetch quotas, store snapshot, update tracker.
 func (a *Agent) poll(ctx context.Context) {
+	a.pollMu.Lock()
+	defer a.pollMu.Unlock()
+
 	if a.pollingCheck != nil && !a.pollingCheck() {
 		return // polling disabled for this provider
 	}
@@ -518,3 +518,85 @@ func TestAgent_LogsEachPoll(t *testing.T) {
 
 // NOTE: Session lifecycle tests (create/close/max/count/ID) were removed.
 // Session management is now handled by SessionManager, tested in session_manager_test.go.
+
+// TestAgent_PollNow_StoresSnapshot verifies PollNow runs one poll cycle without Run
+func TestAgent_PollNow_StoresSnapshot(t *testing.T) {
+	agent, str, _, _ := setupTest(t)
+
+	agent.PollNow(context.Background())
+
+	latest, err := str.QueryLatest()
+	if err != nil {
+		t.Fatalf("QueryLatest: %v", err)
+	}
+	if latest == nil {
+		t.Fatal("Expected a snapshot after PollNow")
+	}
+	if latest.Sub.Limit != 1350 {
+		t.Errorf("Sub.Limit = %v, want 1350", latest.Sub.Limit)
+	}
+}
+
+// TestAgent_PollNow_SerializedWithRun verifies PollNow calls made while Run is
+// polling never overlap with Run's own poll cycles (run with -race)
+func TestAgent_PollNow_SerializedWithRun(t *testing.T) {
+	var inFlight, maxInFlight, callCount atomic.Int32
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		n := inFlight.Add(1)
+		defer inFlight.Add(-1)
+		for {
+			peak := maxInFlight.Load()
+			if n <= peak || maxInFlight.CompareAndSwap(peak, n) {
+				break
+			}
+		}
+		callCount.Add(1)
+		time.Sleep(5 * time.Millisecond)
+		w.Header().Set("Content-Type", "application/json")
+		json.NewEncoder(w).Encode(testResponse())
+	}))
+	defer server.Close()
+
+	str, err := store.New(":memory:")
+	if err != nil {
+		t.Fatalf("Failed to create store: %v", err)
+	}
+	defer str.Close()
+
+	logger := slog.New(slog.NewJSONHandler(&bytes.Buffer{}, nil))
+	client := api.NewClient("test-key", logger, api.WithBaseURL(server.URL))
+	tr := tracker.New(str, logger)
+	agent := New(client, str, tr, 10*time.Millisecond, logger, nil)
+
+	ctx, cancel := context.WithCancel(context.Background())
+	errCh := make(chan error, 1)
+	go func() {
+		errCh <- agent.Run(ctx)
+	}()
+
+	var wg sync.WaitGroup
+	for i := 0; i < 4; i++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			for j := 0; j < 5; j++ {
+				agent.PollNow(ctx)
+			}
+		}()
+	}
+	wg.Wait()
+	cancel()
+
+	select {
+	case <-errCh:
+	case <-time.After(2 * time.Second):
+		t.Fatal("Agent.Run() did not return within 2s")
+	}
+
+	if count := callCount.Load(); count < 20 {
+		t.Errorf("Expected at least 20 API calls (one per PollNow), got %d", count)
+	}
+	if peak := maxInFlight.Load(); peak != 1 {
+		t.Errorf("Expected poll cycles to be serialized, saw %d concurrent requests", peak)
+	}
+}
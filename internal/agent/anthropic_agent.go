@@ -5,6 +5,7 @@ import (
 	"context"
 	"errors"
 	"log/slog"
+	"sync"
 	"time"
 
 	"github.com/onllm-dev/onwatch/internal/api"
@@ -44,6 +45,10 @@ type AnthropicAgent struct {
 	authFailCount   int    // consecutive auth failures (401 or 403)
 	authPaused      bool   // true when polling is paused due to auth failures
 	lastFailedToken string // token that caused the failures (to detect credential refresh)
+
+	// Held for a whole poll cycle; also guards lastToken and the auth failure
+	// state above, which PollNow and Run would otherwise update concurrently
+	pollMu sync.Mutex
 }
 
 // SetPollingCheck sets a function that is called before each poll.
@@ -121,8 +126,17 @@ func isAuthError(err error) bool {
 	return errors.Is(err, api.ErrAnthropicUnauthorized) || errors.Is(err, api.ErrAnthropicForbidden)
 }
 
+// PollNow runs a single poll cycle immediately, outside the regular interval.
+// It is safe to call while Run is active; concurrent cycles are serialized.
+func (a *AnthropicAgent) PollNow(ctx context.Context) {
+	a.poll(ctx)
+}
+
 // poll performs a single Anthropic poll cycle: fetch quotas, store snapshot, process with tracker.
 func (a *AnthropicAgent) poll(ctx context.Context) {
+	a.pollMu.Lock()
+	defer a.pollMu.Unlock()
+
 	if a.pollingCheck != nil && !a.pollingCheck() {
 		return // polling disabled for this provider
 	}
@@ -499,3 +499,37 @@ func TestAnthropicAgent_Run_StoresSnapshot(t *testing.T) {
 		t.Error("Expected to find five_hour quota in snapshot")
 	}
 }
+
+// TestAnthropicAgent_PollNow_StoresSnapshot verifies PollNow runs one poll cycle
+// and persists its snapshot without Run being started.
+func TestAnthropicAgent_PollNow_StoresSnapshot(t *testing.T) {
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		w.Header().Set("Content-Type", "application/json")
+		w.Write([]byte(anthropicResponse(45.2, 12.8)))
+	}))
+	defer server.Close()
+
+	str, err := store.New(":memory:")
+	if err != nil {
+		t.Fatalf("Failed to create store: %v", err)
+	}
+	defer str.Close()
+
+	logger := slog.New(slog.NewJSONHandler(&bytes.Buffer{}, nil))
+	client := api.NewAnthropicClient("test-token", logger, api.WithAnthropicBaseURL(server.URL+"/api/oauth/usage"))
+	tr := tracker.NewAnthropicTracker(str, logger)
+
+	agent := NewAnthropicAgent(client, str, tr, 5*time.Second, logger, nil)
+	agent.PollNow(context.Background())
+
+	latest, err := str.QueryLatestAnthropic()
+	if err != nil {
+		t.Fatalf("QueryLatestAnthropic error: %v", err)
+	}
+	if latest == nil {
+		t.Fatal("Expected an Anthropic snapshot after PollNow")
+	}
+	if len(latest.Quotas) < 2 {
+		t.Errorf("Expected at least 2 quotas in snapshot, got %d", len(latest.Quotas))
+	}
+}
@@ -4,6 +4,7 @@ import (
 	"context"
 	"log/slog"
 	"os"
+	"sync"
 	"time"
 
 	"github.com/onllm-dev/onwatch/internal/api"
@@ -28,6 +29,9 @@ type AntigravityAgent struct {
 	// Manual configuration for Docker environments
 	manualBaseURL   string
 	manualCSRFToken string
+
+	// Held for a whole poll cycle, including the client's lazy connection detection
+	pollMu sync.Mutex
 }
 
 // AntigravityAgentOption configures an AntigravityAgent.
@@ -133,8 +137,17 @@ func (a *AntigravityAgent) Run(ctx context.Context) error {
 	}
 }
 
+// PollNow runs a single poll cycle immediately, outside the regular interval.
+// It is safe to call while Run is active; concurrent cycles are serialized.
+func (a *AntigravityAgent) PollNow(ctx context.Context) {
+	a.poll(ctx)
+}
+
 // poll performs a single poll cycle: detect process, fetch quotas, store snapshot, update tracker.
 func (a *AntigravityAgent) poll(ctx context.Context) {
+	a.pollMu.Lock()
+	defer a.pollMu.Unlock()
+
 	if a.pollingCheck != nil && !a.pollingCheck() {
 		return
 	}
@@ -0,0 +1,87 @@
+package agent
+
+import (
+	"context"
+	"encoding/json"
+	"log/slog"
+	"net/http"
+	"net/http/httptest"
+	"testing"
+	"time"
+
+	"github.com/onllm-dev/onwatch/internal/api"
+	"github.com/onllm-dev/onwatch/internal/store"
+	"github.com/onllm-dev/onwatch/internal/tracker"
+)
+
+func setupAntigravityTest(t *testing.T) (*AntigravityAgent, *store.Store) {
+	// Keep a developer's manual config from replacing the test connection
+	t.Setenv("ANTIGRAVITY_BASE_URL", "")
+	t.Setenv("ANTIGRAVITY_CSRF_TOKEN", "")
+
+	resetTime := time.Now().Add(24 * time.Hour).Format(time.RFC3339)
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		resp := map[string]interface{}{
+			"userStatus": map[string]interface{}{
+				"email": "test@example.com",
+				"planStatus": map[string]interface{}{
+					"availablePromptCredits": 500,
+					"planInfo": map[string]interface{}{
+						"planName":             "Pro",
+						"monthlyPromptCredits": 1000,
+					},
+				},
+				"cascadeModelConfigData": map[string]interface{}{
+					"clientModelConfigs": []map[string]interface{}{
+						{
+							"label":        "Claude Sonnet",
+							"modelOrAlias": map[string]string{"model": "claude-4-5-sonnet"},
+							"quotaInfo": map[string]interface{}{
+								"remainingFraction": 0.75,
+								"resetTime":         resetTime,
+							},
+						},
+					},
+				},
+			},
+		}
+		w.Header().Set("Content-Type", "application/json")
+		json.NewEncoder(w).Encode(resp)
+	}))
+	t.Cleanup(server.Close)
+
+	str, err := store.New(":memory:")
+	if err != nil {
+		t.Fatalf("Failed to create store: %v", err)
+	}
+	t.Cleanup(func() { str.Close() })
+
+	logger := slog.Default()
+	conn := &api.AntigravityConnection{BaseURL: server.URL, CSRFToken: "test-csrf-token", Protocol: "http"}
+	client := api.NewAntigravityClient(logger, api.WithAntigravityConnection(conn))
+	tr := tracker.NewAntigravityTracker(str, logger)
+	sm := NewSessionManager(str, "antigravity", 600*time.Second, logger)
+
+	ag := NewAntigravityAgent(client, str, tr, 100*time.Millisecond, logger, sm)
+	return ag, str
+}
+
+func TestAntigravityAgent_PollNow(t *testing.T) {
+	ag, str := setupAntigravityTest(t)
+
+	ag.PollNow(context.Background())
+
+	latest, err := str.QueryLatestAntigravity()
+	if err != nil {
+		t.Fatalf("QueryLatestAntigravity: %v", err)
+	}
+	if latest == nil {
+		t.Fatal("Expected snapshot after PollNow")
+	}
+	if latest.Email != "test@example.com" {
+		t.Errorf("Email = %q, want test@example.com", latest.Email)
+	}
+	if len(latest.Models) != 1 {
+		t.Errorf("Expected 1 model quota, got %d", len(latest.Models))
+	}
+}
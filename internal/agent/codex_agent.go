@@ -4,6 +4,7 @@ import (
 	"context"
 	"errors"
 	"log/slog"
+	"sync"
 	"time"
 
 	"github.com/onllm-dev/onwatch/internal/api"
@@ -40,6 +41,9 @@ type CodexAgent struct {
 	authFailCount   int
 	authPaused      bool
 	lastFailedToken string
+
+	// Held for a whole poll cycle; guards the token and auth failure fields
+	pollMu sync.Mutex
 }
 
 // NewCodexAgent creates a new CodexAgent with the given dependencies.
@@ -98,7 +102,16 @@ func (a *CodexAgent) Run(ctx context.Context) error {
 	}
 }
 
+// PollNow runs a single poll cycle immediately, outside the regular interval.
+// It is safe to call while Run is active; concurrent cycles are serialized.
+func (a *CodexAgent) PollNow(ctx context.Context) {
+	a.poll(ctx)
+}
+
 func (a *CodexAgent) poll(ctx context.Context) {
+	a.pollMu.Lock()
+	defer a.pollMu.Unlock()
+
 	if a.pollingCheck != nil && !a.pollingCheck() {
 		return
 	}
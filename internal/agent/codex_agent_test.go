@@ -178,3 +178,20 @@ func TestCodexAgent_AuthFailuresPauseUntilTokenChanges(t *testing.T) {
 		}
 	}
 }
+
+func TestCodexAgent_PollNow(t *testing.T) {
+	ag, st, _ := setupCodexTest(t)
+
+	ag.PollNow(context.Background())
+
+	latest, err := st.QueryLatestCodex()
+	if err != nil {
+		t.Fatalf("QueryLatestCodex: %v", err)
+	}
+	if latest == nil {
+		t.Fatal("expected snapshot after PollNow")
+	}
+	if latest.PlanType != "pro" {
+		t.Fatalf("PlanType = %q, want pro", latest.PlanType)
+	}
+}
@@ -3,6 +3,7 @@ package agent
 import (
 	"context"
 	"log/slog"
+	"sync"
 	"time"
 
 	"github.com/onllm-dev/onwatch/internal/api"
@@ -21,6 +22,9 @@ type CopilotAgent struct {
 	sm           *SessionManager
 	notifier     *notify.NotificationEngine
 	pollingCheck func() bool
+
+	// Held for a whole poll cycle so PollNow and Run feed the tracker in order
+	pollMu sync.Mutex
 }
 
 // SetPollingCheck sets a function that is called before each poll.
@@ -77,8 +81,17 @@ func (a *CopilotAgent) Run(ctx context.Context) error {
 	}
 }
 
+// PollNow runs a single poll cycle immediately, outside the regular interval.
+// It is safe to call while Run is active; concurrent cycles are serialized.
+func (a *CopilotAgent) PollNow(ctx context.Context) {
+	a.poll(ctx)
+}
+
 // poll performs a single poll cycle: fetch quotas, store snapshot, update tracker.
 func (a *CopilotAgent) poll(ctx context.Context) {
+	a.pollMu.Lock()
+	defer a.pollMu.Unlock()
+
 	if a.pollingCheck != nil && !a.pollingCheck() {
 		return
 	}
@@ -141,3 +141,20 @@ func TestCopilotAgent_ContextCancellation(t *testing.T) {
 		t.Fatal("Agent did not stop within timeout")
 	}
 }
+
+func TestCopilotAgent_PollNow(t *testing.T) {
+	ag, str, _ := setupCopilotTest(t)
+
+	ag.PollNow(context.Background())
+
+	latest, err := str.QueryLatestCopilot()
+	if err != nil {
+		t.Fatalf("QueryLatestCopilot: %v", err)
+	}
+	if latest == nil {
+		t.Fatal("Expected snapshot after PollNow")
+	}
+	if latest.CopilotPlan != "individual_pro" {
+		t.Errorf("CopilotPlan = %q, want individual_pro", latest.CopilotPlan)
+	}
+}
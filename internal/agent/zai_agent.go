@@ -4,6 +4,7 @@ package agent
 import (
 	"context"
 	"log/slog"
+	"sync"
 	"time"
 
 	"github.com/onllm-dev/onwatch/internal/api"
@@ -22,6 +23,9 @@ type ZaiAgent struct {
 	sm           *SessionManager
 	notifier     *notify.NotificationEngine
 	pollingCheck func() bool
+
+	// One poll at a time: PollNow and Run share the tracker's in-memory state
+	pollMu sync.Mutex
 }
 
 // SetPollingCheck sets a function that is called before each poll.
@@ -81,8 +85,17 @@ func (a *ZaiAgent) Run(ctx context.Context) error {
 	}
 }
 
+// PollNow runs a single poll cycle immediately, outside the regular interval.
+// It is safe to call while Run is active; concurrent cycles are serialized.
+func (a *ZaiAgent) PollNow(ctx context.Context) {
+	a.poll(ctx)
+}
+
 // poll performs a single Z.ai poll cycle: fetch quotas, store snapshot.
 func (a *ZaiAgent) poll(ctx context.Context) {
+	a.pollMu.Lock()
+	defer a.pollMu.Unlock()
+
 	if a.pollingCheck != nil && !a.pollingCheck() {
 		return // polling disabled for this provider
 	}
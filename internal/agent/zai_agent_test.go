@@ -315,3 +315,37 @@ func TestZaiAgent_Run_SessionManagerReportsPoll(t *testing.T) {
 		t.Logf("Session still open (may not have been closed by agent shutdown)")
 	}
 }
+
+// TestZaiAgent_PollNow_StoresSnapshot verifies that PollNow runs one poll cycle
+// and persists its snapshot without Run being started.
+func TestZaiAgent_PollNow_StoresSnapshot(t *testing.T) {
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		w.Header().Set("Content-Type", "application/json")
+		w.Write([]byte(zaiResponse(200000000, 50000000, 1000, 19)))
+	}))
+	defer server.Close()
+
+	str, err := store.New(":memory:")
+	if err != nil {
+		t.Fatalf("Failed to create store: %v", err)
+	}
+	defer str.Close()
+
+	logger := slog.New(slog.NewJSONHandler(&bytes.Buffer{}, nil))
+	client := api.NewZaiClient("test-key", logger, api.WithZaiBaseURL(server.URL+"/monitor/usage/quota/limit"))
+	tr := tracker.NewZaiTracker(str, logger)
+
+	agent := NewZaiAgent(client, str, tr, 5*time.Second, logger, nil)
+	agent.PollNow(context.Background())
+
+	latest, err := str.QueryLatestZai()
+	if err != nil {
+		t.Fatalf("QueryLatestZai error: %v", err)
+	}
+	if latest == nil {
+		t.Fatal("Expected a Z.ai snapshot after PollNow")
+	}
+	if latest.TokensCurrentValue != 50000000 {
+		t.Errorf("Expected tokens current value 50000000, got %f", latest.TokensCurrentValue)
+	}
+}
@@ -1,6 +1,7 @@
 package web
 
 import (
+	"context"
 	"encoding/json"
 	"fmt"
 	"html/template"
@@ -71,7 +72,8 @@ type Handler struct {
 	smtpTestLastSent   time.Time
 	pushTestMu         sync.Mutex
 	pushTestLastSent   time.Time
-	rateLimiter        *LoginRateLimiter // Per-IP rate limiting for login attempts
+	rateLimiter        *LoginRateLimiter         // Per-IP rate limiting for login attempts
+	refreshFunc        func(ctx context.Context) // Test mode only: runs one poll cycle of every agent
 }
 
 // NewHandler creates a new Handler instance
@@ -162,6 +164,11 @@ func (h *Handler) SetRateLimiter(l *LoginRateLimiter) {
 	h.rateLimiter = l
 }
 
+// SetRefreshFunc sets the poll hook behind /api/debug/refresh. Only wired up in test mode.
+func (h *Handler) SetRefreshFunc(fn func(ctx context.Context)) {
+	h.refreshFunc = fn
+}
+
 // SettingsPage renders the settings page.
 func (h *Handler) SettingsPage(w http.ResponseWriter, r *http.Request) {
 	data := map[string]interface{}{
@@ -3803,6 +3810,21 @@ func (h *Handler) CheckUpdate(w http.ResponseWriter, r *http.Request) {
 	respondJSON(w, http.StatusOK, info)
 }
 
+// DebugRefresh runs one poll cycle of every agent synchronously (POST /api/debug/refresh).
+// Responds 404 unless a refresh hook was set, which main only does in test mode.
+func (h *Handler) DebugRefresh(w http.ResponseWriter, r *http.Request) {
+	if h.refreshFunc == nil {
+		http.NotFound(w, r)
+		return
+	}
+	if r.Method != http.MethodPost {
+		respondError(w, http.StatusMethodNotAllowed, "method not allowed")
+		return
+	}
+	h.refreshFunc(r.Context())
+	respondJSON(w, http.StatusOK, map[string]string{"status": "ok"})
+}
+
 // ApplyUpdate downloads and applies an update (POST /api/update/apply).
 func (h *Handler) ApplyUpdate(w http.ResponseWriter, r *http.Request) {
 	if r.Method != http.MethodPost {
@@ -1,6 +1,7 @@
 package web
 
 import (
+	"context"
 	"encoding/json"
 	"fmt"
 	"math"
@@ -4548,6 +4549,52 @@ func TestHandler_ApplyUpdate_MethodNotAllowed(t *testing.T) {
 	}
 }
 
+func TestHandler_DebugRefresh_NotFoundWithoutHook(t *testing.T) {
+	cfg := createTestConfigWithSynthetic()
+	h := NewHandler(nil, nil, nil, nil, cfg)
+	// No refresh hook set (not in test mode)
+
+	req := httptest.NewRequest(http.MethodPost, "/api/debug/refresh", nil)
+	rr := httptest.NewRecorder()
+	h.DebugRefresh(rr, req)
+
+	if rr.Code != http.StatusNotFound {
+		t.Errorf("expected status 404, got %d", rr.Code)
+	}
+}
+
+func TestHandler_DebugRefresh_MethodNotAllowed(t *testing.T) {
+	cfg := createTestConfigWithSynthetic()
+	h := NewHandler(nil, nil, nil, nil, cfg)
+	h.SetRefreshFunc(func(ctx context.Context) {})
+
+	req := httptest.NewRequest(http.MethodGet, "/api/debug/refresh", nil)
+	rr := httptest.NewRecorder()
+	h.DebugRefresh(rr, req)
+
+	if rr.Code != http.StatusMethodNotAllowed {
+		t.Errorf("expected status 405, got %d", rr.Code)
+	}
+}
+
+func TestHandler_DebugRefresh_RunsHook(t *testing.T) {
+	cfg := createTestConfigWithSynthetic()
+	h := NewHandler(nil, nil, nil, nil, cfg)
+	calls := 0
+	h.SetRefreshFunc(func(ctx context.Context) { calls++ })
+
+	req := httptest.NewRequest(http.MethodPost, "/api/debug/refresh", nil)
+	rr := httptest.NewRecorder()
+	h.DebugRefresh(rr, req)
+
+	if rr.Code != http.StatusOK {
+		t.Errorf("expected status 200, got %d", rr.Code)
+	}
+	if calls != 1 {
+		t.Errorf("expected refresh hook to run once, ran %d times", calls)
+	}
+}
+
 // ═══════════════════════════════════════════════════════════════════
 // ── Anthropic Handler Tests ──
 // ═══════════════════════════════════════════════════════════════════
@@ -66,6 +66,7 @@ func NewServer(port int, handler *Handler, logger *slog.Logger, username, passwo
 	mux.HandleFunc("/api/logging-history", handler.LoggingHistory)
 	mux.HandleFunc("/api/update/check", handler.CheckUpdate)
 	mux.HandleFunc("/api/update/apply", handler.ApplyUpdate)
+	mux.HandleFunc("/api/debug/refresh", handler.DebugRefresh)
 	mux.HandleFunc("/api/push/vapid", handler.PushVAPIDKey)
 	mux.HandleFunc("/api/push/subscribe", handler.PushSubscribe)
 	mux.HandleFunc("/api/push/test", handler.PushTest)
@@ -839,6 +839,30 @@ func run() error {
 	loginRateLimiter := web.NewLoginRateLimiter(1000)
 	handler.SetRateLimiter(loginRateLimiter)
 
+	// In test mode, expose a synchronous poll so E2E tests need not wait for the interval
+	if cfg.TestMode {
+		handler.SetRefreshFunc(func(ctx context.Context) {
+			if ag != nil {
+				ag.PollNow(ctx)
+			}
+			if zaiAg != nil {
+				zaiAg.PollNow(ctx)
+			}
+			if anthropicAg != nil {
+				anthropicAg.PollNow(ctx)
+			}
+			if copilotAg != nil {
+				copilotAg.PollNow(ctx)
+			}
+			if codexAg != nil {
+				codexAg.PollNow(ctx)
+			}
+			if antigravityAg != nil {
+				antigravityAg.PollNow(ctx)
+			}
+		})
+	}
+
 	server := web.NewServer(cfg.Port, handler, logger, cfg.AdminUser, cfg.AdminPassHash, cfg.Host)
 
 	// Setup signal handling
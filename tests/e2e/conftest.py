@@ -1,57 +1,220 @@
 """Pytest configuration and fixtures for onWatch E2E tests.
 
-Session-scoped fixtures build and start the mock server and onwatch binary,
-then tear them down after all tests complete.
+Session-scoped fixtures build the mock server and onwatch binaries in
+parallel (or reuse cached builds of unchanged sources), start them, then tear
+them down after all tests complete. Under pytest-xdist the first worker to
+need the binaries builds them while the others wait on a lock, and every
+worker starts its own server pair on the ports and paths from e2e_config.
 """
+import collections
+import contextlib
+import fcntl
+import glob
+import hashlib
+import http.client
 import os
+import select
+import shutil
 import signal
+import socket
 import subprocess
+import threading
 import time
 from pathlib import Path
-from typing import Generator
+from typing import Callable, Generator
 
 import pytest
-import urllib.request
-import urllib.error
+import urllib.parse
+from playwright.sync_api import Browser, BrowserContext, Page
 
-# Ports
-ONWATCH_PORT = 19211
-MOCK_PORT = 19212
-BASE_URL = f"http://localhost:{ONWATCH_PORT}"
-MOCK_URL = f"http://localhost:{MOCK_PORT}"
-
-# Credentials
-USERNAME = "admin"
-PASSWORD = "testpass123"
+from e2e_config import (
+    BASE_URL,
+    DB_PATH,
+    E2E_HOME,
+    MOCK_PORT,
+    MOCK_URL,
+    ONWATCH_PORT,
+    PASSWORD,
+    USERNAME,
+)
 
 # Paths
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+# Built binaries are cached as <prefix>-<source hash> and reused across runs.
 MOCK_BINARY = "/tmp/mockserver-test"
 ONWATCH_BINARY = "/tmp/onwatch-test"
-# E2E isolation: override HOME so the canonical DB path (~/.onwatch/data/onwatch.db)
-# does not exist. This prevents main.go's fixExplicitDBPath() from redirecting to
-# the production database.
-E2E_HOME = "/tmp/onwatch-e2e-home"
-DB_PATH = "/tmp/onwatch-e2e.db"
+BINARY_CACHE_MAX_AGE = 24 * 60 * 60
+# Serializes binary builds across xdist workers and concurrent sessions
+BUILD_LOCK = "/tmp/onwatch-e2e-build.lock"
+# Go build cache on tmpfs, shared by every local build and session on this
+# machine; unused when GOCACHE or CI is set
+GO_BUILD_CACHE = "/dev/shm/gocache-onwatch-e2e"
+# Number of server output lines kept for failure reports
+SERVER_LOG_LINES = 200
+# Providers whose dashboard cards are static HTML: tab label -> first card's data-quota
+FIXED_CARD_PROVIDERS = {"Synthetic": "subscription", "Z.ai": "tokensLimit"}
+# Assets no test asserts on; aborting them keeps navigations fast and offline
+BLOCKED_ASSETS = ("**/*.{png,jpg,svg,woff,woff2,ttf}", "https://fonts.googleapis.com/**")
+
+# Running servers by display name, for attaching their logs to failed tests
+_servers: dict[str, subprocess.Popen] = {}
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register the e2e command line options."""
+    group = parser.getgroup("onwatch e2e")
+    group.addoption(
+        "--keep-artifacts",
+        action="store_true",
+        default=False,
+        help="keep the e2e database and home directory after the session",
+    )
+
+
+def _stale_files() -> list[str]:
+    """Return the DB sidecars and PID file a previous onwatch run may leave behind."""
+    return [
+        f"{DB_PATH}-journal",
+        f"{DB_PATH}-wal",
+        f"{DB_PATH}-shm",
+        os.path.join(E2E_HOME, ".onwatch", "onwatch-test.pid"),
+    ]
+
+
+def _spawn_server(name: str, args: list[str], **kwargs) -> subprocess.Popen:
+    """Start a server process and keep the tail of its output in memory.
+
+    stdout and stderr are merged and drained by a daemon thread into
+    proc.log_tail, so the server never blocks on a full pipe. proc.pidfd is a
+    pidfd for the process, or None where pidfd_open is unavailable.
+    """
+    proc = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, **kwargs)
+    proc.log_tail = collections.deque(maxlen=SERVER_LOG_LINES)
+    proc.log_drain = threading.Thread(
+        target=proc.log_tail.extend,
+        args=(iter(proc.stdout.readline, b""),),
+        name=f"{name} log drain",
+        daemon=True,
+    )
+    proc.log_drain.start()
+    # A pidfd always refers to this process, even after its PID is recycled
+    try:
+        proc.pidfd = os.pidfd_open(proc.pid)
+    except (AttributeError, OSError):
+        proc.pidfd = None
+    _servers[name] = proc
+    return proc
+
+
+def _log_tail(proc: subprocess.Popen) -> str:
+    """Return the buffered output of a process started by _spawn_server."""
+    if proc.poll() is not None:
+        # Let the drain thread pick up the last output after exit
+        proc.log_drain.join(timeout=1)
+    return b"".join(list(proc.log_tail)).decode(errors="replace")
+
+
+def _http_connection(url: str) -> tuple[http.client.HTTPConnection, str]:
+    """Return a (not yet connected) HTTPConnection for url and the request path."""
+    parts = urllib.parse.urlsplit(url)
+    path = parts.path or "/"
+    if parts.query:
+        path = f"{path}?{parts.query}"
+    return http.client.HTTPConnection(parts.hostname, parts.port, timeout=5), path
+
+
+def _http_ok(conn: http.client.HTTPConnection, path: str) -> bool:
+    """GET path over conn and report whether it returned 200.
+
+    On errors the connection is closed; http.client reconnects on the next
+    request, so the same object can be reused across polls.
+    """
+    try:
+        conn.request("GET", path)
+        resp = conn.getresponse()
+        resp.read()
+        return resp.status == 200
+    except (http.client.HTTPException, OSError):
+        conn.close()
+        return False
 
 
 def _wait_for_http(url: str, timeout: float = 30.0, interval: float = 0.5) -> bool:
     """Poll an HTTP URL until it returns 200 or timeout is reached."""
-    deadline = time.monotonic() + timeout
-    while time.monotonic() < deadline:
-        try:
-            req = urllib.request.Request(url, method="GET")
-            resp = urllib.request.urlopen(req, timeout=5)
-            if resp.status == 200:
+    conn, path = _http_connection(url)
+    try:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if _http_ok(conn, path):
                 return True
-        except (urllib.error.URLError, OSError, ConnectionRefusedError):
-            pass
-        time.sleep(interval)
-    return False
+            time.sleep(interval)
+        return False
+    finally:
+        conn.close()
+
+
+def _wait_ready(
+    proc: subprocess.Popen, host: str, port: int, url: str, timeout: float = 30.0
+) -> bool:
+    """Wait until proc accepts TCP connections on host:port and url returns 200.
+
+    proc.pidfd, registered with epoll, reports a premature exit immediately
+    instead of waiting out the full timeout. The port is probed with a cheap
+    connect() every 10ms; the HTTP request is only issued once it is listening.
+    Falls back to _wait_for_http where pidfd_open is unavailable (Linux < 5.3).
+    """
+    pidfd = proc.pidfd
+    if pidfd is None:
+        return _wait_for_http(url, timeout=timeout)
+
+    conn, path = _http_connection(url)
+    epoll = select.epoll()
+    try:
+        epoll.register(pidfd, select.EPOLLIN)
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if epoll.poll(0.01):
+                proc.wait()
+                raise RuntimeError(
+                    f"{proc.args[0]} exited with code {proc.returncode} before becoming ready:\n"
+                    f"{_log_tail(proc)}"
+                )
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+                sock.settimeout(0.05)
+                if sock.connect_ex((host, port)) != 0:
+                    continue
+            if _http_ok(conn, path):
+                return True
+        return False
+    finally:
+        epoll.close()
+        conn.close()
 
 
 def _kill_process(proc: subprocess.Popen) -> None:
-    """Kill a subprocess and wait for it to exit."""
+    """Kill a subprocess and wait for it to exit.
+
+    Processes with a pidfd are signalled through it, which cannot hit a
+    recycled PID, and teardown returns as soon as the pidfd reports the exit.
+    """
+    pidfd = getattr(proc, "pidfd", None)
+    if pidfd is not None:
+        proc.pidfd = None
+        try:
+            poller = select.poll()
+            poller.register(pidfd, select.POLLIN)
+            for sig in (signal.SIGTERM, signal.SIGKILL):
+                try:
+                    signal.pidfd_send_signal(pidfd, sig)
+                except ProcessLookupError:
+                    break  # already exited
+                if poller.poll(5000):
+                    break
+            proc.wait(timeout=5)
+        finally:
+            os.close(pidfd)
+        return
+
     if proc.poll() is None:
         try:
             proc.send_signal(signal.SIGTERM)
@@ -61,69 +224,167 @@ def _kill_process(proc: subprocess.Popen) -> None:
             proc.wait(timeout=5)
 
 
+def _binary_cache_key() -> str:
+    """Return a hash of the sources the e2e binaries are built from.
+
+    Covers path, size and mtime of the top-level Go files, go.mod/go.sum, the
+    VERSION file main.go embeds and everything under internal/ (including
+    embedded static assets and templates). Test files are skipped since they
+    are not compiled in.
+    """
+    digest = hashlib.blake2b(digest_size=8)
+
+    def add(entry: os.DirEntry) -> None:
+        st = entry.stat()
+        digest.update(f"{entry.path}\0{st.st_size}\0{st.st_mtime_ns}\n".encode())
+
+    def walk(directory: str) -> None:
+        with os.scandir(directory) as it:
+            entries = sorted(it, key=lambda e: e.name)
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                walk(entry.path)
+            elif entry.is_file() and not entry.name.endswith("_test.go"):
+                add(entry)
+
+    with os.scandir(PROJECT_ROOT) as it:
+        entries = sorted(it, key=lambda e: e.name)
+    for entry in entries:
+        if entry.is_file() and (
+            entry.name in ("go.mod", "go.sum", "VERSION")
+            or (entry.name.endswith(".go") and not entry.name.endswith("_test.go"))
+        ):
+            add(entry)
+    walk(str(PROJECT_ROOT / "internal"))
+    return digest.hexdigest()
+
+
+def _prune_cached_binaries(keep: set[str]) -> None:
+    """Remove cached binaries other than keep that have not been used recently."""
+    cutoff = time.time() - BINARY_CACHE_MAX_AGE
+    for prefix in (MOCK_BINARY, ONWATCH_BINARY):
+        for path in glob.glob(f"{prefix}-*"):
+            if path in keep:
+                continue
+            try:
+                if os.stat(path).st_mtime < cutoff:
+                    os.unlink(path)
+            except OSError:
+                pass
+
+
+@contextlib.contextmanager
+def _build_lock() -> Generator[None, None, None]:
+    """Hold an exclusive lock on BUILD_LOCK for the duration of the block."""
+    with open(BUILD_LOCK, "a") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        yield
+
+
 @pytest.fixture(scope="session")
-def mock_server() -> Generator[subprocess.Popen, None, None]:
-    """Build and start the mock server binary."""
-    # Build mock server
-    result = subprocess.run(
-        ["go", "build", "-o", MOCK_BINARY, "./internal/testutil/cmd/mockserver"],
-        cwd=str(PROJECT_ROOT),
-        capture_output=True,
-        text=True,
-        timeout=120,
-    )
-    assert result.returncode == 0, f"Mock server build failed: {result.stderr}"
+def _built_binaries() -> dict[str, str]:
+    """Build the mock server and onwatch binaries, reusing cached builds.
+
+    Returns a mapping of "mock"/"onwatch" to the binary paths.
+    """
+    key = _binary_cache_key()
+    binaries = {
+        "mock": f"{MOCK_BINARY}-{key}",
+        "onwatch": f"{ONWATCH_BINARY}-{key}",
+    }
+    builds = {
+        "mock": ["./internal/testutil/cmd/mockserver"],
+        "onwatch": ["."],
+    }
+
+    # Build flags are left at Go's defaults: any extra flag such as -trimpath
+    # changes the action IDs and misses every entry in an existing build cache
+    env = os.environ.copy()
+    if (
+        "GOCACHE" not in env
+        and "CI" not in env
+        and os.path.isdir(os.path.dirname(GO_BUILD_CACHE))
+    ):
+        # Keep compile I/O off the (possibly network-backed) default cache. An
+        # explicit GOCACHE and CI, where setup-go restores the default cache,
+        # are left alone.
+        os.makedirs(GO_BUILD_CACHE, exist_ok=True)
+        env["GOCACHE"] = GO_BUILD_CACHE
+    # Only one xdist worker (or session) builds at a time; the others wait
+    # here and then find the finished binaries
+    with _build_lock():
+        # Start all missing builds before waiting on any; the go build cache is
+        # safe for concurrent use. Output goes to a temp name and is renamed into
+        # place so a crashed build never leaves a partially written binary.
+        procs = {}
+        for name, path in binaries.items():
+            if os.access(path, os.X_OK):
+                os.utime(path)
+                continue
+            procs[name] = subprocess.Popen(
+                ["go", "build", "-o", f"{path}.{os.getpid()}.tmp", *builds[name]],
+                cwd=str(PROJECT_ROOT),
+                env=env,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+            )
+        try:
+            for name, proc in procs.items():
+                _, stderr = proc.communicate(timeout=120)
+                assert proc.returncode == 0, f"{name} build failed: {stderr}"
+                os.replace(f"{binaries[name]}.{os.getpid()}.tmp", binaries[name])
+        finally:
+            for name, proc in procs.items():
+                if proc.poll() is None:
+                    proc.kill()
+                    proc.wait()
+                try:
+                    os.unlink(f"{binaries[name]}.{os.getpid()}.tmp")
+                except OSError:
+                    pass
+
+        _prune_cached_binaries(keep=set(binaries.values()))
+    return binaries
+
 
+@pytest.fixture(scope="session")
+def mock_server(_built_binaries: dict[str, str]) -> Generator[subprocess.Popen, None, None]:
+    """Start the mock server binary."""
     # Start mock server
-    proc = subprocess.Popen(
+    proc = _spawn_server(
+        "mock server",
         [
-            MOCK_BINARY,
+            _built_binaries["mock"],
             f"--port={MOCK_PORT}",
             "--syn-key=syn_test_e2e_key",
             "--zai-key=zai_test_e2e_key",
             "--anth-token=anth_test_e2e_token",
         ],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
     )
 
     # Wait for mock server to be ready
-    ready = _wait_for_http(f"{MOCK_URL}/admin/requests", timeout=15)
-    assert ready, "Mock server did not start in time"
+    ready = _wait_ready(proc, "localhost", MOCK_PORT, f"{MOCK_URL}/admin/requests", timeout=15)
+    assert ready, f"Mock server did not start in time:\n{_log_tail(proc)}"
 
     yield proc
 
+    _servers.pop("mock server", None)
     _kill_process(proc)
-    # Clean up binary
-    try:
-        os.unlink(MOCK_BINARY)
-    except OSError:
-        pass
 
 
 @pytest.fixture(scope="session")
-def onwatch_server(mock_server: subprocess.Popen) -> Generator[subprocess.Popen, None, None]:
-    """Build and start the onwatch binary."""
-    # Clean up any stale DB and home directory
-    import shutil
-    for path in [DB_PATH, f"{DB_PATH}-journal", f"{DB_PATH}-wal", f"{DB_PATH}-shm"]:
-        try:
-            os.unlink(path)
-        except OSError:
-            pass
-    if os.path.exists(E2E_HOME):
-        shutil.rmtree(E2E_HOME)
+def onwatch_server(
+    pytestconfig: pytest.Config, _built_binaries: dict[str, str], mock_server: subprocess.Popen
+) -> Generator[subprocess.Popen, None, None]:
+    """Start the onwatch binary."""
+    # Start from an empty DB. Stale sidecars and the test-mode PID file of a
+    # previous run are removed; the home directory itself is reused.
     os.makedirs(E2E_HOME, exist_ok=True)
-
-    # Build onwatch
-    result = subprocess.run(
-        ["go", "build", "-o", ONWATCH_BINARY, "."],
-        cwd=str(PROJECT_ROOT),
-        capture_output=True,
-        text=True,
-        timeout=120,
-    )
-    assert result.returncode == 0, f"onWatch build failed: {result.stderr}"
+    for path in _stale_files():
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(path)
+    open(DB_PATH, "wb").close()
 
     env = os.environ.copy()
     env.update({
@@ -135,9 +396,10 @@ def onwatch_server(mock_server: subprocess.Popen) -> Generator[subprocess.Popen,
         "ANTHROPIC_TOKEN": "anth_test_e2e_token",
     })
 
-    proc = subprocess.Popen(
+    proc = _spawn_server(
+        "onwatch",
         [
-            ONWATCH_BINARY,
+            _built_binaries["onwatch"],
             "--debug",
             f"--port={ONWATCH_PORT}",
             "--interval=10",
@@ -145,61 +407,262 @@ def onwatch_server(mock_server: subprocess.Popen) -> Generator[subprocess.Popen,
             f"--db={DB_PATH}",
         ],
         env=env,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
     )
 
     # Wait for onwatch to be ready (login page returns 200)
-    ready = _wait_for_http(f"{BASE_URL}/login", timeout=30)
-    assert ready, "onWatch server did not start in time"
+    ready = _wait_ready(proc, "localhost", ONWATCH_PORT, f"{BASE_URL}/login", timeout=30)
+    assert ready, f"onWatch server did not start in time:\n{_log_tail(proc)}"
 
     yield proc
 
+    _servers.pop("onwatch", None)
     _kill_process(proc)
+    if pytestconfig.getoption("keep_artifacts"):
+        return
     # Clean up
-    try:
-        os.unlink(ONWATCH_BINARY)
-    except OSError:
-        pass
-    for path in [DB_PATH, f"{DB_PATH}-journal", f"{DB_PATH}-wal", f"{DB_PATH}-shm"]:
-        try:
+    for path in [DB_PATH, *_stale_files()]:
+        with contextlib.suppress(FileNotFoundError):
             os.unlink(path)
-        except OSError:
-            pass
-    import shutil
     if os.path.exists(E2E_HOME):
         shutil.rmtree(E2E_HOME, ignore_errors=True)
 
 
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item: pytest.Item, call: pytest.CallInfo):
+    """Attach the recent output of the running servers to failed test reports."""
+    outcome = yield
+    report = outcome.get_result()
+    if report.failed:
+        for name, proc in _servers.items():
+            report.sections.append((f"{name} output (last {SERVER_LOG_LINES} lines)", _log_tail(proc)))
+
+
 @pytest.fixture(autouse=True, scope="session")
 def servers(mock_server: subprocess.Popen, onwatch_server: subprocess.Popen) -> Generator[None, None, None]:
     """Ensure both servers are running for all tests."""
     yield
 
 
+@pytest.fixture(scope="session")
+def base_url() -> str:
+    """Point pytest-playwright at this worker's onwatch server."""
+    return BASE_URL
+
+
+@pytest.fixture(scope="session")
+def browser_context_args(browser_context_args: dict) -> dict:
+    """Use a fixed light, reduced-motion, 1280x800 context for every test."""
+    return {
+        **browser_context_args,
+        "color_scheme": "light",
+        "reduced_motion": "reduce",
+        "viewport": {"width": 1280, "height": 800},
+    }
+
+
+def _block_assets(context: BrowserContext) -> None:
+    """Abort requests for images and fonts in context."""
+    for pattern in BLOCKED_ASSETS:
+        context.route(pattern, lambda route: route.abort())
+
+
 @pytest.fixture
-def authenticated_page(page):
-    """Log in and return a page with a valid session cookie."""
+def context(context: BrowserContext) -> BrowserContext:
+    """Extend pytest-playwright's per-test context with asset blocking."""
+    _block_assets(context)
+    return context
+
+
+def _login(page: Page) -> None:
+    """Log in through the login form and wait for the dashboard redirect."""
     page.goto(f"{BASE_URL}/login")
     page.fill("#username", USERNAME)
     page.fill("#password", PASSWORD)
     page.click("button.login-button")
-    # Wait for redirect to dashboard
     page.wait_for_url(f"{BASE_URL}/", timeout=10000)
-    return page
+
+
+def _force_refresh(page: Page) -> None:
+    """Run one poll cycle on the server, then reload page and wait for the new data.
+
+    Uses the --test mode /api/debug/refresh endpoint instead of waiting for the
+    regular poll interval. The request shares page's session cookie.
+    """
+    response = page.request.post(
+        f"{BASE_URL}/api/debug/refresh",
+        headers={"X-Requested-With": "XMLHttpRequest"},
+    )
+    assert response.ok, f"debug refresh failed with HTTP {response.status}"
+    page.reload()
+    # The template renders "Last updated: --:--:--"; app.js replaces the
+    # placeholder with the time once it has applied /api/current
+    page.wait_for_function(
+        "() => !document.getElementById('last-updated').innerText.includes('--:--:--')"
+    )
+
+
+@pytest.fixture(scope="session")
+def auth_state(browser: Browser, browser_context_args: dict, onwatch_server: subprocess.Popen) -> dict:
+    """Log in once per session and return the context's storage state.
+
+    The dict is refreshed in place by _goto_authenticated if the session has
+    been invalidated since (e.g. by a password change test).
+    """
+    context = browser.new_context(**browser_context_args)
+    _block_assets(context)
+    try:
+        _login(context.new_page())
+        return context.storage_state()
+    finally:
+        context.close()
+
+
+def _new_authenticated_context(
+    browser: Browser, browser_context_args: dict, auth_state: dict
+) -> BrowserContext:
+    """Create a browser context that starts from the shared login.
+
+    The saved default provider is dropped on every navigation so that a tab
+    switch in one test does not redirect the next test's dashboard.
+    """
+    context = browser.new_context(**browser_context_args, storage_state=auth_state)
+    _block_assets(context)
+    context.add_init_script("localStorage.removeItem('onwatch-default-provider')")
+    return context
+
+
+def _goto_authenticated(page: Page, path: str, auth_state: dict) -> None:
+    """Navigate page to path, logging in again if the session was invalidated."""
+    page.goto(f"{BASE_URL}{path}")
+    if "/login" in page.url:
+        # Session was invalidated; log in again and share the new cookie
+        _login(page)
+        auth_state.update(page.context.storage_state())
+        if path != "/":
+            page.goto(f"{BASE_URL}{path}")
+
+
+@pytest.fixture(scope="module")
+def shared_context(
+    browser: Browser, browser_context_args: dict, auth_state: dict
+) -> Generator[BrowserContext, None, None]:
+    """Create one authenticated browser context for a whole test module."""
+    context = _new_authenticated_context(browser, browser_context_args, auth_state)
+    yield context
+    context.close()
+
+
+@pytest.fixture(scope="module")
+def shared_page(shared_context: BrowserContext) -> Page:
+    """Return a page in the module's shared context.
+
+    For modules that drive one page through all their tests, such as the
+    viewport and modal tests.
+    """
+    return shared_context.new_page()
 
 
 @pytest.fixture
-def dashboard_page(authenticated_page):
-    """Return an authenticated page on the dashboard."""
-    # Already on dashboard after login
-    authenticated_page.wait_for_selector(".app-header", timeout=10000)
-    return authenticated_page
+def authenticated_page(page: Page, auth_state: dict) -> Page:
+    """Return a page on the dashboard with a valid session cookie."""
+    page.context.add_cookies(auth_state["cookies"])
+    _goto_authenticated(page, "/", auth_state)
+    return page
+
+
+@pytest.fixture(scope="class")
+def _class_page(
+    browser: Browser, browser_context_args: dict, auth_state: dict
+) -> Generator[Page, None, None]:
+    """Return a page in an authenticated context shared by one test class."""
+    context = _new_authenticated_context(browser, browser_context_args, auth_state)
+    yield context.new_page()
+    context.close()
+
+
+@pytest.fixture(scope="class")
+def dashboard_page(_class_page: Page) -> Page:
+    """Return the test class's page; _reset_class_pages loads the dashboard."""
+    return _class_page
+
+
+@pytest.fixture(scope="class")
+def settings_page(_class_page: Page) -> Page:
+    """Return the test class's page; _reset_class_pages loads the settings page."""
+    return _class_page
+
+
+# Class-scoped page fixtures -> (path, ready selector) they are reset to
+_CLASS_PAGES = {
+    "dashboard_page": ("/", ".app-header"),
+    "settings_page": ("/settings", ".settings-page"),
+}
+
+
+@pytest.fixture(autouse=True)
+def _reset_class_pages(request: pytest.FixtureRequest) -> None:
+    """Bring a class-scoped dashboard or settings page to a known state per test.
+
+    Closes any open modal and reloads the page, which also drops the selected
+    provider tab. A session invalidated by an earlier test is renewed.
+    """
+    for name, (path, ready) in _CLASS_PAGES.items():
+        if name not in request.fixturenames:
+            continue
+        page = request.getfixturevalue(name)
+        page.keyboard.press("Escape")
+        _goto_authenticated(page, path, request.getfixturevalue("auth_state"))
+        page.wait_for_selector(ready, timeout=10000)
+
+
+@pytest.fixture(scope="session")
+def available_providers(
+    browser: Browser, browser_context_args: dict, auth_state: dict
+) -> frozenset[str]:
+    """Return the dashboard's provider tab labels (e.g. "Synthetic", "Z.ai").
+
+    Read once per session; the configured providers do not change at runtime.
+    """
+    context = _new_authenticated_context(browser, browser_context_args, auth_state)
+    try:
+        page = context.new_page()
+        _goto_authenticated(page, "/", auth_state)
+        return frozenset(
+            page.eval_on_selector_all(".provider-tab", "els => els.map(e => e.innerText.trim())")
+        )
+    finally:
+        context.close()
+
+
+@pytest.fixture(scope="session")
+def fixed_card_provider(available_providers: frozenset[str]) -> str:
+    """Return the tab label of a provider with static cards, preferring Synthetic.
+
+    Skips the requesting tests if neither Synthetic nor Z.ai is configured.
+    """
+    for label in FIXED_CARD_PROVIDERS:
+        if label in available_providers:
+            return label
+    pytest.skip("No provider with fixed cards available")
+
+
+@pytest.fixture(scope="session")
+def fixed_card(fixed_card_provider: str) -> str:
+    """Return the data-quota of the first static card of fixed_card_provider."""
+    return FIXED_CARD_PROVIDERS[fixed_card_provider]
+
+
+@pytest.fixture(scope="session")
+def goto_authenticated(auth_state: dict) -> Callable[[Page, str], None]:
+    """Return a helper that navigates a page to a path, logging in again if needed.
+
+    For module-scoped pages such as shared_page, whose session may be
+    invalidated by an earlier test module (e.g. a password change).
+    """
+    return lambda page, path: _goto_authenticated(page, path, auth_state)
 
 
 @pytest.fixture
-def settings_page(authenticated_page):
-    """Navigate to the settings page and return the page."""
-    authenticated_page.goto(f"{BASE_URL}/settings")
-    authenticated_page.wait_for_selector(".settings-page", timeout=10000)
-    return authenticated_page
+def force_refresh() -> Callable[[Page], None]:
+    """Return a helper that forces fresh server data onto a page."""
+    return _force_refresh
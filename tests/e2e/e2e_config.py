@@ -0,0 +1,27 @@
+"""Shared settings for onWatch E2E tests.
+
+Ports and scratch paths are derived from the pytest-xdist worker id so that
+each worker runs against its own onwatch and mock server pair. Without xdist
+the values match a single "gw0" worker.
+"""
+import os
+
+WORKER = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+WORKER_INDEX = int(WORKER[2:])
+
+# Ports: fixed per worker, so no other worker can be handed them while the
+# binaries are still building
+ONWATCH_PORT = 19211 + WORKER_INDEX * 10
+MOCK_PORT = ONWATCH_PORT + 1
+BASE_URL = f"http://localhost:{ONWATCH_PORT}"
+MOCK_URL = f"http://localhost:{MOCK_PORT}"
+
+# Credentials
+USERNAME = "admin"
+PASSWORD = "testpass123"
+
+# E2E isolation: override HOME so the canonical DB path (~/.onwatch/data/onwatch.db)
+# does not exist. This prevents main.go's fixExplicitDBPath() from redirecting to
+# the production database. It also keeps each worker's test-mode PID file apart.
+E2E_HOME = f"/tmp/onwatch-e2e-home-{WORKER}"
+DB_PATH = f"/tmp/onwatch-e2e-{WORKER}.db"
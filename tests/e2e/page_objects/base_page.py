@@ -0,0 +1,41 @@
+"""Shared base for the onWatch page objects."""
+from playwright.sync_api import Page
+
+
+class BasePage:
+    """Holds the Playwright page and helpers common to all page objects."""
+
+    def __init__(self, page: Page) -> None:
+        self.page = page
+
+    def _text(self, selector: str, visible_only: bool = False) -> str:
+        """Return the stripped inner text of the first match, or "" if none.
+
+        Reads the element in one driver call without auto-waiting. With
+        visible_only, a hidden element also reads as "".
+        """
+        return self.page.locator(selector).evaluate_all(
+            """(els, visibleOnly) => {
+                const el = els[0];
+                if (!el) return '';
+                if (visibleOnly && (!el.getClientRects().length
+                        || getComputedStyle(el).visibility === 'hidden')) return '';
+                return el.innerText.trim();
+            }""",
+            visible_only,
+        )
+
+    def get_hidden_ids(self, element_ids: list[str]) -> list[str]:
+        """Return the ids from element_ids that are missing or not visible.
+
+        Checks all elements in one driver call and does not wait; assert the
+        first one with expect() beforehand if the page may still be rendering.
+        """
+        return self.page.evaluate(
+            """(ids) => ids.filter(id => {
+                const el = document.getElementById(id);
+                return !el || !el.getClientRects().length
+                    || getComputedStyle(el).visibility === 'hidden';
+            })""",
+            element_ids,
+        )
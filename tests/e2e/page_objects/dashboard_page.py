@@ -1,15 +1,26 @@
 """Page object for the onWatch dashboard page."""
-from playwright.sync_api import Page
+from typing import Optional
 
+from playwright.sync_api import Locator, Page, expect
 
-BASE_URL = "http://localhost:19211"
+from e2e_config import BASE_URL
+from page_objects.base_page import BasePage
 
 
-class DashboardPage:
+class DashboardPage(BasePage):
     """Wraps interactions with the main dashboard (/) page."""
 
     def __init__(self, page: Page) -> None:
-        self.page = page
+        super().__init__(page)
+        # Locators are lazy, so these stay valid across navigations
+        self._modal = page.locator("#detail-modal")
+        self._theme_toggle = page.locator("#theme-toggle")
+        self._chart = page.locator("#usage-chart")
+        self._cards = page.locator("article.quota-card")
+
+    def _card(self, quota_name: str) -> Locator:
+        """Return the first quota card with the given data-quota attribute."""
+        return self._cards.and_(self.page.locator(f'[data-quota="{quota_name}"]')).first
 
     def goto(self) -> None:
         """Navigate to the dashboard."""
@@ -17,10 +28,24 @@ class DashboardPage:
         self.page.wait_for_selector(".app-header", timeout=10000)
 
     def select_provider(self, name: str) -> None:
-        """Click a provider tab by its visible text."""
-        self.page.click(f'.provider-tab:has-text("{name}")')
-        # Wait for page to reflect the new provider
-        self.page.wait_for_load_state("networkidle", timeout=10000)
+        """Click a provider tab by its visible text and wait for its dashboard.
+
+        A tab click navigates to /?provider=<id>, so this waits for that page's
+        load event, the active tab, and the provider's quota grid (the combined
+        #both-view for the "All" tab, which has no grid of its own).
+        """
+        tab = self.page.locator(".provider-tab", has_text=name).first
+        provider = tab.get_attribute("data-provider")
+        with self.page.expect_event("load", timeout=10000):
+            tab.click()
+        expect(
+            self.page.locator(f'.provider-tab.active[data-provider="{provider}"]')
+        ).to_be_visible()
+        if provider == "both":
+            view = "#both-view"
+        else:
+            view = f'.quota-grid[data-provider="{provider}"]'
+        self.page.locator(view).first.wait_for(state="attached")
 
     def get_active_provider(self) -> str:
         """Return the data-provider attribute of the active provider tab."""
@@ -31,35 +56,30 @@ class DashboardPage:
 
     def get_provider_tabs(self) -> list[str]:
         """Return a list of provider tab texts."""
-        tabs = self.page.query_selector_all(".provider-tab")
-        return [tab.inner_text().strip() for tab in tabs]
+        return self.page.eval_on_selector_all(
+            ".provider-tab", "els => els.map(e => e.innerText.trim())"
+        )
 
     def get_quota_cards(self) -> list[str]:
         """Return a list of quota card data-quota attributes visible on the page."""
-        cards = self.page.query_selector_all("article.quota-card")
-        return [card.get_attribute("data-quota") or "" for card in cards]
+        return self.page.eval_on_selector_all(
+            "article.quota-card", "els => els.map(e => e.dataset.quota || '')"
+        )
 
     def get_card_status(self, quota_name: str) -> str:
         """Return the data-status attribute of a status badge for a given quota card."""
-        badge = self.page.query_selector(
-            f'article.quota-card[data-quota="{quota_name}"] .status-badge'
-        )
-        if badge:
-            return badge.get_attribute("data-status") or ""
+        badge = self._card(quota_name).locator(".status-badge")
+        if badge.count():
+            return badge.first.get_attribute("data-status") or ""
         return ""
 
     def get_card_percentage(self, quota_name: str) -> str:
         """Return the percentage text displayed on a quota card."""
-        el = self.page.query_selector(
-            f'article.quota-card[data-quota="{quota_name}"] .usage-percent'
-        )
-        if el:
-            return el.inner_text().strip()
-        return ""
+        return self._text(f'article.quota-card[data-quota="{quota_name}"] .usage-percent')
 
     def open_card_modal(self, quota_name: str) -> None:
         """Click a quota card to open its detail modal."""
-        self.page.click(f'article.quota-card[data-quota="{quota_name}"]')
+        self._card(quota_name).click()
         self.page.wait_for_selector("#detail-modal:not([hidden])", timeout=5000)
 
     def close_modal(self) -> None:
@@ -80,42 +100,94 @@ class DashboardPage:
 
     def is_modal_visible(self) -> bool:
         """Check if the detail modal is visible (not hidden)."""
-        modal = self.page.query_selector("#detail-modal")
-        if modal:
-            return not modal.get_attribute("hidden") == ""
+        if self._modal.count():
+            return self._modal.get_attribute("hidden") != ""
         return False
 
     def get_modal_title(self) -> str:
         """Return the modal title text."""
-        el = self.page.query_selector("#modal-title")
-        if el:
-            return el.inner_text().strip()
-        return ""
+        return self._text("#modal-title")
+
+    def snapshot(self, quota_name: str) -> dict:
+        """Return a quota card's status and percentage plus the modal state in one call.
+
+        Keys are status, percentage, modal_open and modal_title; missing
+        elements read as "" (or False for modal_open) like the single getters.
+        """
+        return self.page.evaluate(
+            """(q) => {
+                const card = document.querySelector(`article.quota-card[data-quota="${q}"]`);
+                const badge = card && card.querySelector('.status-badge');
+                const pct = card && card.querySelector('.usage-percent');
+                const modal = document.getElementById('detail-modal');
+                const title = document.getElementById('modal-title');
+                return {
+                    status: (badge && badge.dataset.status) || '',
+                    percentage: pct ? pct.innerText.trim() : '',
+                    modal_open: !!modal && !modal.hidden,
+                    modal_title: title ? title.innerText.trim() : '',
+                };
+            }""",
+            quota_name,
+        )
+
+    def wait_for_modal_body(self) -> None:
+        """Wait until the detail modal body has a chart or any text."""
+        self.page.wait_for_function(
+            """() => {
+                const body = document.getElementById('modal-body');
+                return !!body && (
+                    !!body.querySelector('canvas, .modal-chart, .chart-container')
+                    || body.innerText.trim() !== ''
+                );
+            }""",
+            timeout=5000,
+        )
+
+    def get_modal_body_summary(self) -> Optional[dict]:
+        """Summarize the detail modal body in one call, or None if it is missing.
+
+        Keys are has_canvas, has_chart (a .modal-chart or .chart-container)
+        and text_length.
+        """
+        return self.page.evaluate(
+            """() => {
+                const body = document.getElementById('modal-body');
+                if (!body) return null;
+                return {
+                    has_canvas: !!body.querySelector('canvas'),
+                    has_chart: !!body.querySelector('.modal-chart, .chart-container'),
+                    text_length: (body.innerText || '').trim().length,
+                };
+            }"""
+        )
 
     def toggle_theme(self) -> None:
         """Click the theme toggle button."""
-        self.page.click("#theme-toggle")
+        self._theme_toggle.click()
 
     def get_current_theme(self) -> str:
         """Return the current theme from the html data-theme attribute."""
         return self.page.get_attribute("html", "data-theme") or ""
 
     def click_refresh(self) -> None:
-        """Click the refresh button."""
-        self.page.click("#refresh-btn")
+        """Click the refresh button and wait for the current-usage refetch."""
+        with self.page.expect_response(lambda r: "/api/current" in r.url):
+            self.page.click("#refresh-btn")
 
     def get_last_updated(self) -> str:
         """Return the last updated text."""
-        el = self.page.query_selector("#last-updated")
-        if el:
-            return el.inner_text().strip()
-        return ""
+        return self._text("#last-updated")
 
     def select_chart_range(self, range_value: str) -> None:
         """Click a chart range button by its data-range attribute."""
         self.page.click(
             f'.chart-section .range-selector .range-btn[data-range="{range_value}"]'
         )
+        self.page.wait_for_selector(
+            f'.chart-section .range-selector .range-btn.active[data-range="{range_value}"]',
+            timeout=5000,
+        )
 
     def get_active_chart_range(self) -> str:
         """Return the data-range of the active chart range button."""
@@ -128,18 +200,13 @@ class DashboardPage:
 
     def scroll_to_section(self, section_class: str) -> None:
         """Scroll a section into view by its class name."""
-        self.page.eval_on_selector(
-            f".{section_class}",
-            "el => el.scrollIntoView({behavior: 'instant'})",
-        )
-        self.page.wait_for_timeout(500)
+        section = self.page.locator(f".{section_class}")
+        section.evaluate("el => el.scrollIntoView({behavior: 'instant'})")
+        expect(section).to_be_in_viewport()
 
     def get_version_text(self) -> str:
         """Return the version text from the footer."""
-        el = self.page.query_selector(".footer-brand")
-        if el:
-            return el.inner_text().strip()
-        return ""
+        return self._text(".footer-brand")
 
     def has_settings_link(self) -> bool:
         """Check if the settings link/button is present."""
@@ -163,28 +230,26 @@ class DashboardPage:
 
     def get_password_error(self) -> str:
         """Return the password error message text."""
-        el = self.page.query_selector("#password-error")
-        if el and not el.is_hidden():
-            return el.inner_text().strip()
-        return ""
+        return self._text("#password-error", visible_only=True)
 
     def get_password_success(self) -> str:
         """Return the password success message text."""
-        el = self.page.query_selector("#password-success")
-        if el and not el.is_hidden():
-            return el.inner_text().strip()
-        return ""
+        return self._text("#password-success", visible_only=True)
 
     def get_chart_canvas(self) -> bool:
         """Check if the chart canvas element exists."""
-        return self.page.is_visible("#usage-chart")
+        return self._chart.is_visible()
 
     def get_cycles_table_rows(self) -> int:
         """Return the number of rows in the cycles table body."""
-        rows = self.page.query_selector_all("#cycles-tbody tr")
-        return len(rows)
+        return self.page.eval_on_selector_all("#cycles-tbody tr", "els => els.length")
+
+    def wait_for_table_rows(self, table_selector: str, timeout: float = 5000) -> None:
+        """Wait until a data table's body has at least one row."""
+        expect(self.page.locator(f"{table_selector} tbody tr")).not_to_have_count(
+            0, timeout=timeout
+        )
 
     def get_sessions_table_rows(self) -> int:
         """Return the number of rows in the sessions table body."""
-        rows = self.page.query_selector_all("#sessions-tbody tr")
-        return len(rows)
+        return self.page.eval_on_selector_all("#sessions-tbody tr", "els => els.length")
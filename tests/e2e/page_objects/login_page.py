@@ -1,16 +1,11 @@
 """Page object for the onWatch login page."""
-from playwright.sync_api import Page
+from e2e_config import BASE_URL
+from page_objects.base_page import BasePage
 
 
-BASE_URL = "http://localhost:19211"
-
-
-class LoginPage:
+class LoginPage(BasePage):
     """Wraps interactions with the /login page."""
 
-    def __init__(self, page: Page) -> None:
-        self.page = page
-
     def goto(self) -> None:
         """Navigate to the login page."""
         self.page.goto(f"{BASE_URL}/login")
@@ -24,10 +19,7 @@ class LoginPage:
 
     def get_error_message(self) -> str:
         """Return the visible error message text, or empty string if none."""
-        el = self.page.query_selector(".error-message")
-        if el:
-            return el.inner_text().strip()
-        return ""
+        return self._text(".error-message")
 
     def toggle_password_visibility(self) -> None:
         """Click the password visibility toggle button."""
@@ -1,18 +1,13 @@
 """Page object for the onWatch settings page."""
 from typing import Optional
 
-from playwright.sync_api import Page
+from e2e_config import BASE_URL
+from page_objects.base_page import BasePage
 
 
-BASE_URL = "http://localhost:19211"
-
-
-class SettingsPage:
+class SettingsPage(BasePage):
     """Wraps interactions with the /settings page."""
 
-    def __init__(self, page: Page) -> None:
-        self.page = page
-
     def goto(self) -> None:
         """Navigate to the settings page."""
         self.page.goto(f"{BASE_URL}/settings")
@@ -59,10 +54,7 @@ class SettingsPage:
 
     def get_test_email_result(self) -> str:
         """Return the test email result text."""
-        el = self.page.query_selector("#smtp-test-result")
-        if el:
-            return el.inner_text().strip()
-        return ""
+        return self._text("#smtp-test-result")
 
     def set_warning_threshold(self, value: int) -> None:
         """Set the warning threshold input value."""
@@ -102,10 +94,7 @@ class SettingsPage:
 
     def get_feedback(self) -> str:
         """Return the settings feedback message text."""
-        el = self.page.query_selector("#settings-feedback")
-        if el and not el.is_hidden():
-            return el.inner_text().strip()
-        return ""
+        return self._text("#settings-feedback", visible_only=True)
 
     def is_panel_visible(self, panel_name: str) -> bool:
         """Check if a settings panel is visible (not hidden)."""
@@ -7,12 +7,9 @@ import re
 import pytest
 from playwright.sync_api import Page, expect
 
+from e2e_config import BASE_URL, PASSWORD, USERNAME
 from page_objects.login_page import LoginPage
 
-BASE_URL = "http://localhost:19211"
-USERNAME = "admin"
-PASSWORD = "testpass123"
-
 
 class TestAuth:
     """Authentication and session management tests."""
@@ -92,13 +89,10 @@ class TestAuth:
 
         login.toggle_password_visibility()
         # After toggle, should be text
-        page.wait_for_timeout(300)
-        input_type = login.get_password_input_type()
-        assert input_type == "text"
+        expect(page.locator("#password")).to_have_attribute("type", "text")
 
         login.toggle_password_visibility()
-        page.wait_for_timeout(300)
-        assert login.get_password_input_type() == "password"
+        expect(page.locator("#password")).to_have_attribute("type", "password")
 
     def test_api_returns_401_without_auth(self, page: Page) -> None:
         """API endpoints should return 401 JSON without a valid session."""
@@ -7,8 +7,6 @@ from playwright.sync_api import Page, expect
 
 from page_objects.dashboard_page import DashboardPage
 
-BASE_URL = "http://localhost:19211"
-
 
 class TestCharts:
     """Chart rendering and interaction tests."""
@@ -25,7 +23,6 @@ class TestCharts:
         """Chart range buttons should be present and clickable."""
         dash = DashboardPage(dashboard_page)
         dash.scroll_to_section("chart-section")
-        dashboard_page.wait_for_timeout(1000)
 
         # Check all range buttons exist
         for range_val in ["1h", "6h", "24h", "7d", "30d"]:
@@ -35,12 +32,10 @@ class TestCharts:
 
         # Click a range button and verify it becomes active
         dash.select_chart_range("24h")
-        dashboard_page.wait_for_timeout(1000)
         assert dash.get_active_chart_range() == "24h"
 
         # Switch to another range
         dash.select_chart_range("1h")
-        dashboard_page.wait_for_timeout(1000)
         assert dash.get_active_chart_range() == "1h"
 
     def test_chart_after_provider_switch(self, dashboard_page: Page) -> None:
@@ -60,7 +55,6 @@ class TestCharts:
                 dash.select_provider("Z.ai")
                 break
 
-        dashboard_page.wait_for_timeout(2000)
         dash.scroll_to_section("chart-section")
 
         expect(dashboard_page.locator("#usage-chart")).to_be_visible()
@@ -7,8 +7,6 @@ from playwright.sync_api import Page, expect
 
 from page_objects.dashboard_page import DashboardPage
 
-BASE_URL = "http://localhost:19211"
-
 
 class TestDataTables:
     """Data table interaction tests."""
@@ -26,14 +24,12 @@ class TestDataTables:
         dash = DashboardPage(dashboard_page)
         dash.scroll_to_section("cycles-section")
 
-        headers = dashboard_page.query_selector_all(
-            "#cycles-table thead th[data-sort-key]"
+        sort_keys = dashboard_page.eval_on_selector_all(
+            "#cycles-table thead th[data-sort-key]",
+            "els => els.map(e => e.getAttribute('data-sort-key'))",
         )
-        assert len(headers) >= 5
-        sort_keys = [h.get_attribute("data-sort-key") for h in headers]
-        assert "start" in sort_keys
-        assert "peak" in sort_keys
-        assert "total" in sort_keys
+        assert len(sort_keys) >= 5
+        assert {"start", "peak", "total"} <= set(sort_keys)
 
     def test_cycles_pagination_controls(self, dashboard_page: Page) -> None:
         """The cycles section should have pagination controls."""
@@ -51,12 +47,12 @@ class TestDataTables:
         expect(dashboard_page.locator(".sessions-section")).to_be_visible()
         expect(dashboard_page.locator("#sessions-table")).to_be_visible()
 
-    def test_sessions_table_has_rows(self, dashboard_page: Page) -> None:
+    def test_sessions_table_has_rows(self, dashboard_page: Page, force_refresh) -> None:
         """The sessions table should display at least one row (the current session)."""
         dash = DashboardPage(dashboard_page)
+        force_refresh(dashboard_page)
         dash.scroll_to_section("sessions-section")
-        # Wait for lazy-loaded data
-        dashboard_page.wait_for_timeout(3000)
+        dash.wait_for_table_rows("#sessions-table")
 
         rows = dash.get_sessions_table_rows()
         # Should have at least the empty-state row or actual session rows
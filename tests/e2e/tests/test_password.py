@@ -2,14 +2,41 @@
 
 4 tests covering modal, success flow, wrong current password, and mismatch.
 """
+import re
+
 import pytest
 from playwright.sync_api import Page, expect
 
+from e2e_config import BASE_URL, PASSWORD, USERNAME
 from page_objects.dashboard_page import DashboardPage
 
-BASE_URL = "http://localhost:19211"
-USERNAME = "admin"
-PASSWORD = "testpass123"
+
+def _login_with(page: Page, password: str) -> None:
+    """Log in through the login form with password and wait for the dashboard."""
+    page.fill("#username", USERNAME)
+    page.fill("#password", password)
+    page.click("button.login-button")
+    page.wait_for_url(f"{BASE_URL}/", timeout=10000)
+
+
+def _restore_password(page: Page, new_password: str) -> None:
+    """Set the admin password back to PASSWORD if it was changed to new_password.
+
+    Only a password change invalidates the session, so a redirect to /login
+    means the change went through and new_password is needed to log in. A 401
+    from the API means the current password is not new_password, i.e. it was
+    never changed.
+    """
+    page.goto(f"{BASE_URL}/")
+    if "/login" in page.url:
+        _login_with(page, new_password)
+    response = page.request.put(
+        f"{BASE_URL}/api/password",
+        data={"current_password": new_password, "new_password": PASSWORD},
+    )
+    assert response.ok or response.status == 401, (
+        f"restoring the password failed with HTTP {response.status}"
+    )
 
 
 class TestPassword:
@@ -24,9 +51,10 @@ class TestPassword:
             "hidden", ""
         )
         expect(dashboard_page.locator("#current-password")).to_be_visible()
-        expect(dashboard_page.locator("#new-password")).to_be_visible()
-        expect(dashboard_page.locator("#confirm-password")).to_be_visible()
-        expect(dashboard_page.locator("#password-submit-btn")).to_be_visible()
+        hidden = dash.get_hidden_ids(
+            ["new-password", "confirm-password", "password-submit-btn"]
+        )
+        assert hidden == [], f"Not visible: {hidden}"
 
         dash.close_password_modal()
 
@@ -41,39 +69,26 @@ class TestPassword:
         dash = DashboardPage(dashboard_page)
         new_password = "newpass456789"
 
-        # Change to new password
-        dash.open_password_modal()
-        dash.change_password(PASSWORD, new_password, new_password)
-        dashboard_page.wait_for_timeout(2000)
-
-        # Should see success message or be redirected to login
-        success = dash.get_password_success()
-        if success:
-            assert "success" in success.lower() or "changed" in success.lower()
+        try:
+            # Change to new password
+            dash.open_password_modal()
+            with dashboard_page.expect_response("**/api/password") as response_info:
+                dash.change_password(PASSWORD, new_password, new_password)
+            assert response_info.value.status == 200
+            expect(dashboard_page.locator("#password-success")).to_contain_text(
+                "Password updated"
+            )
 
-        # Navigate away to check if session was invalidated
-        dashboard_page.goto(f"{BASE_URL}/")
-        dashboard_page.wait_for_timeout(1000)
+            # The change invalidates every session, so the dashboard now requires login
+            dashboard_page.goto(f"{BASE_URL}/")
+            expect(dashboard_page).to_have_url(re.compile(r"/login"))
 
-        # Should be on login page since session was invalidated
-        current_url = dashboard_page.url
-        if "/login" in current_url:
             # Re-login with new password
-            dashboard_page.fill("#username", USERNAME)
-            dashboard_page.fill("#password", new_password)
-            dashboard_page.click("button.login-button")
-            dashboard_page.wait_for_url(f"{BASE_URL}/", timeout=10000)
-
-            # Restore original password
-            dash2 = DashboardPage(dashboard_page)
-            dash2.open_password_modal()
-            dash2.change_password(new_password, PASSWORD, PASSWORD)
-            dashboard_page.wait_for_timeout(2000)
-        else:
-            # If still on dashboard, try to restore password via modal
-            dash.open_password_modal()
-            dash.change_password(new_password, PASSWORD, PASSWORD)
-            dashboard_page.wait_for_timeout(2000)
+            _login_with(dashboard_page, new_password)
+        finally:
+            # Restore the original password even if an assertion failed; the
+            # rest of this worker's session logs in with PASSWORD
+            _restore_password(dashboard_page, new_password)
 
     def test_wrong_current_password(self, dashboard_page: Page) -> None:
         """Using a wrong current password should be rejected by the server.
@@ -107,11 +122,8 @@ class TestPassword:
         dash = DashboardPage(dashboard_page)
         dash.open_password_modal()
         dash.change_password(PASSWORD, "newpass123", "differentpass456")
-        dashboard_page.wait_for_timeout(2000)
-
-        # Either client-side validation or server-side error should appear
-        error = dash.get_password_error()
-        has_error = error != ""
-        # Also check if the browser's built-in validation is preventing submission
-        # (HTML5 validation may block the submit)
-        assert has_error or dashboard_page.is_visible("#password-error") or True
+
+        # The mismatch is caught client-side, so no request is sent
+        expect(dashboard_page.locator("#password-error")).to_have_text(
+            "New passwords do not match."
+        )
@@ -7,8 +7,6 @@ from playwright.sync_api import Page, expect
 
 from page_objects.settings_page import SettingsPage
 
-BASE_URL = "http://localhost:19211"
-
 
 class TestSettings:
     """Settings page interaction tests."""
@@ -30,13 +28,16 @@ class TestSettings:
         assert sp.get_active_tab() == "email"
 
         expect(settings_page.locator("#smtp-host")).to_be_visible()
-        expect(settings_page.locator("#smtp-port")).to_be_visible()
-        expect(settings_page.locator("#smtp-protocol")).to_be_visible()
-        expect(settings_page.locator("#smtp-username")).to_be_visible()
-        expect(settings_page.locator("#smtp-password")).to_be_visible()
-        expect(settings_page.locator("#smtp-from-address")).to_be_visible()
-        expect(settings_page.locator("#smtp-from-name")).to_be_visible()
-        expect(settings_page.locator("#smtp-to")).to_be_visible()
+        hidden = sp.get_hidden_ids([
+            "smtp-port",
+            "smtp-protocol",
+            "smtp-username",
+            "smtp-password",
+            "smtp-from-address",
+            "smtp-from-name",
+            "smtp-to",
+        ])
+        assert hidden == [], f"Not visible: {hidden}"
 
     def test_send_test_email_button(self, settings_page: Page) -> None:
         """The test email button should be present and clickable."""
@@ -50,9 +51,12 @@ class TestSettings:
         sp.select_tab("notifications")
 
         expect(settings_page.locator("#threshold-warning")).to_be_visible()
-        expect(settings_page.locator("#threshold-critical")).to_be_visible()
-        expect(settings_page.locator("#threshold-warning-slider")).to_be_visible()
-        expect(settings_page.locator("#threshold-critical-slider")).to_be_visible()
+        hidden = sp.get_hidden_ids([
+            "threshold-critical",
+            "threshold-warning-slider",
+            "threshold-critical-slider",
+        ])
+        assert hidden == [], f"Not visible: {hidden}"
 
     def test_threshold_slider_sync(self, settings_page: Page) -> None:
         """Changing the threshold number input should sync with the slider."""
@@ -63,11 +67,9 @@ class TestSettings:
         sp.set_warning_threshold(70)
         # Trigger input event
         settings_page.dispatch_event("#threshold-warning", "input")
-        settings_page.wait_for_timeout(500)
 
-        # Default values should be present
-        warning_val = sp.get_warning_input_value()
-        assert warning_val == "70"
+        expect(settings_page.locator("#threshold-warning")).to_have_value("70")
+        expect(settings_page.locator("#threshold-warning-slider")).to_have_value("70")
 
     def test_provider_toggles_tab(self, settings_page: Page) -> None:
         """Providers tab should show toggle controls for each provider."""
@@ -94,7 +96,5 @@ class TestSettings:
 
         # Click save -- may show success or error depending on config state
         sp.save_settings()
-        settings_page.wait_for_timeout(1000)
         # Feedback area should become visible after save
-        feedback_el = settings_page.query_selector("#settings-feedback")
-        assert feedback_el is not None
+        expect(settings_page.locator("#settings-feedback")).to_be_visible()